@@ -2,9 +2,40 @@ import random
 import tkinter as tk
 from tkinter import messagebox
 
+# Generador de números aleatorios propio del juego, para poder fijar su semilla
+_generador = random.Random()
+
+# Función para fijar la semilla y empezar una partida reproducible
+def fijar_semilla(semilla):
+    _generador.seed(semilla)
+    nueva_partida()
+
+# Estrategia por defecto: probar siempre el punto medio del rango
+def busqueda_binaria(minimo, maximo):
+    return (minimo + maximo) // 2
+
+# Función que juega una partida completa y devuelve el número de intentos usados.
+# Por defecto usa búsqueda binaria, que nunca necesita más de 7 intentos en 1-100.
+def jugar(numero_secreto, minimo=1, maximo=100, adivinador=None):
+    if adivinador is None:
+        adivinador = busqueda_binaria
+    intentos = 0
+    while minimo <= maximo:
+        intento = adivinador(minimo, maximo)
+        if not minimo <= intento <= maximo:
+            raise ValueError("El intento {} está fuera del rango {}-{}".format(intento, minimo, maximo))
+        intentos += 1
+        if intento == numero_secreto:
+            return intentos
+        elif intento < numero_secreto:
+            minimo = intento + 1
+        else:
+            maximo = intento - 1
+    raise ValueError("El número secreto {} no está en el rango".format(numero_secreto))
+
 # Función para verificar el intento del jugador
 def verificar_intentos():
-    global intentos_restantes
+    global intentos_restantes, minimo, maximo
     intento = None
     try:
         intento = int(entry_intentos.get())
@@ -17,47 +48,70 @@ def verificar_intentos():
         elif intento < numero_secreto:
             messagebox.showinfo("Fallaste", "El número es mayor que {}".format(intento))
             intentos_restantes -= 1
+            minimo = max(minimo, intento + 1)
         else:
             messagebox.showinfo("Fallaste", "El número es menor que {}".format(intento))
             intentos_restantes -= 1
+            maximo = min(maximo, intento - 1)
         if intentos_restantes == 0:
             messagebox.showinfo("Derrota", "¡Te quedaste sin intentos! El número secreto era: {}".format(numero_secreto))
             reiniciar_juego()
         else:
-            label_intentos.config(text="Intentos restantes: {}".format(intentos_restantes))
+            actualizar_etiquetas()
+
+# Función para actualizar los textos enlazados a las etiquetas
+def actualizar_etiquetas():
+    intentos_var.set("Intentos restantes: {}".format(intentos_restantes))
+    pista_var.set("Pista: prueba con {} (rango {}-{})".format((minimo + maximo) // 2, minimo, maximo))
+
+# Función para empezar una partida nueva sin tocar la interfaz
+def nueva_partida():
+    global numero_secreto, intentos_restantes, minimo, maximo
+    numero_secreto = _generador.randint(1, 100)
+    intentos_restantes = 5
+    minimo, maximo = 1, 100
 
 # Función para reiniciar el juego
 def reiniciar_juego():
-    global numero_secreto, intentos_restantes
-    numero_secreto = random.randint(1, 100)
-    intentos_restantes = 5
-    label_intentos.config(text="Intentos restantes: {}".format(intentos_restantes))
+    nueva_partida()
+    actualizar_etiquetas()
     entry_intentos.delete(0, tk.END)
 
-# Crear ventana principal
-root = tk.Tk()
-root.title("Adivinanza")
-root.geometry("300x200")
-
 # Variables globales
-numero_secreto = random.randint(1, 100)
-intentos_restantes = 5
+nueva_partida()
+
+# Función para crear la ventana principal y sus widgets
+def crear_ventana():
+    global intentos_var, pista_var, entry_intentos
+    root = tk.Tk()
+    root.title("Adivinanza")
+    root.geometry("300x200")
+
+    # Las variables de texto necesitan la ventana creada y deben existir antes que las etiquetas
+    intentos_var = tk.StringVar()
+    pista_var = tk.StringVar()
+    actualizar_etiquetas()
+
+    label_instrucciones = tk.Label(root, text="Estoy pensando en un número del 1 al 100. Intenta adivinar cuál es ese número.")
+    label_instrucciones.pack(pady=10)
+
+    entry_intentos = tk.Entry(root)
+    entry_intentos.pack(pady=10)
 
-# Crear widgets
-label_instrucciones = tk.Label(root, text="Estoy pensando en un número del 1 al 100. Intenta adivinar cuál es ese número.")
-label_instrucciones.pack(pady=10)
+    btn_verificar = tk.Button(root, text="Verificar", command=verificar_intentos)
+    btn_verificar.pack()
 
-entry_intentos = tk.Entry(root)
-entry_intentos.pack(pady=10)
+    label_intentos = tk.Label(root, textvariable=intentos_var)
+    label_intentos.pack()
 
-btn_verificar = tk.Button(root, text="Verificar", command=verificar_intentos)
-btn_verificar.pack()
+    label_pista = tk.Label(root, textvariable=pista_var)
+    label_pista.pack()
 
-label_intentos = tk.Label(root, text="Intentos restantes: {}".format(intentos_restantes))
-label_intentos.pack()
+    btn_reiniciar = tk.Button(root, text="Reiniciar", command=reiniciar_juego)
+    btn_reiniciar.pack()
 
-btn_reiniciar = tk.Button(root, text="Reiniciar", command=reiniciar_juego)
-btn_reiniciar.pack()
+    return root
 
 # Iniciar bucle de eventos
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    crear_ventana().mainloop()
\ No newline at end of file
@@ -0,0 +1,52 @@
+import tkinter as tk
+
+import pytest
+
+import adivinanza
+from adivinanza import fijar_semilla, jugar
+
+
+@pytest.fixture(autouse=True)
+def semilla():
+    fijar_semilla(0)
+
+
+def test_busqueda_binaria_nunca_supera_siete_intentos():
+    assert max(jugar(s) for s in range(1, 101)) == 7
+
+
+def test_adivinador_lineal_usa_tantos_intentos_como_el_secreto():
+    for s in range(1, 101):
+        assert jugar(s, adivinador=lambda minimo, maximo: minimo) == s
+
+
+def test_secreto_fuera_de_rango_lanza_error():
+    with pytest.raises(ValueError):
+        jugar(101)
+
+
+def test_intento_fuera_de_rango_lanza_error():
+    with pytest.raises(ValueError):
+        jugar(50, adivinador=lambda minimo, maximo: 1)
+
+
+def test_fijar_semilla_fija_la_partida_actual():
+    secreto = adivinanza.numero_secreto
+    adivinanza.nueva_partida()
+    fijar_semilla(0)
+    assert adivinanza.numero_secreto == secreto
+    assert adivinanza.intentos_restantes == 5
+    assert (adivinanza.minimo, adivinanza.maximo) == (1, 100)
+
+
+def test_etiquetas_muestran_su_variable_de_texto():
+    try:
+        root = adivinanza.crear_ventana()
+    except tk.TclError:
+        pytest.skip("No hay pantalla disponible para Tk")
+    try:
+        textos = [w.cget("text") for w in root.winfo_children() if isinstance(w, tk.Label)]
+        assert "Intentos restantes: 5" in textos
+        assert "Pista: prueba con 50 (rango 1-100)" in textos
+    finally:
+        root.destroy()